@@ -1,76 +1,190 @@
 import gdstk
 import argparse
+import functools
 import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# Per-polygon output (header and points lines), bound once at import
+POLY_TEMPLATE = (
+    "    Polygon - Layer {layer}, datatype {dt}\n"
+    "      Points: {pts}"
+).format
+
+
+def format_points(points):
+    """Format a point array with NumPy's formatter, summarizing large arrays."""
+    return np.array2string(points, threshold=64, max_line_width=200, separator=',')
+
+
+def _poly_stats(pts):
+    """Return vertex count, area and bounding box of a single polygon."""
+    n = pts.shape[0]
+    area = 0.0
+    min_x = max_x = pts[0, 0]
+    min_y = max_y = pts[0, 1]
+    for i in range(n):
+        j = (i + 1) % n
+        area += pts[i, 0] * pts[j, 1] - pts[j, 0] * pts[i, 1]
+        min_x = min(min_x, pts[i, 0])
+        max_x = max(max_x, pts[i, 0])
+        min_y = min(min_y, pts[i, 1])
+        max_y = max(max_y, pts[i, 1])
+    return n, 0.5 * abs(area), min_x, min_y, max_x, max_y
+
+
+@functools.cache
+def _poly_stats_kernel():
+    """
+    Return _poly_stats compiled with numba, or as plain Python without numba.
 
+    numba is optional and slow to import, so it is only loaded the first time
+    summary statistics are requested, not for the default or --raw modes.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _poly_stats
+    return njit(cache=True)(_poly_stats)
 
-def inspect_gds(gds_file, log_file=None):
+
+def summarize_polygons(polygons):
     """
-    Inspect a GDS file and print its structure.
+    Aggregate statistics over a list of gdstk polygons.
 
-    Args:
-        gds_file: Path to the GDS file to read
-        log_file: Optional path to log file. If None, prints to stdout
+    Returns:
+        Tuple of (total vertices, total area, bounding box) where the bounding
+        box is ((min_x, min_y), (max_x, max_y)), or None for an empty list
     """
-    # Set up output
+    poly_stats = _poly_stats_kernel()
+    vertices = 0
+    area = 0.0
+    bbox = None
+    for poly in polygons:
+        n, a, x0, y0, x1, y1 = poly_stats(poly.points)
+        vertices += n
+        area += a
+        if bbox is None:
+            bbox = [x0, y0, x1, y1]
+        else:
+            bbox[0] = min(bbox[0], x0)
+            bbox[1] = min(bbox[1], y0)
+            bbox[2] = max(bbox[2], x1)
+            bbox[3] = max(bbox[3], y1)
+    # Plain floats, so the output is identical whether or not numba compiled
+    # the kernel (the Python fallback yields NumPy scalars)
+    if bbox is not None:
+        bbox = ((float(bbox[0]), float(bbox[1])), (float(bbox[2]), float(bbox[3])))
+    return vertices, float(area), bbox
+
+
+def write_output(lines, log_file=None):
+    """Write collected output lines to log_file, or to stdout if None."""
+    text = "\n".join(lines) + "\n"
     if log_file:
-        output = open(log_file, 'w')
+        with open(log_file, 'w') as output:
+            output.write(text)
     else:
-        output = sys.stdout
-
-    try:
-        library = gdstk.read_gds(gds_file)
-
-        # Inspect structure
-        print(f"Library: {library.name}", file=output)
-        print(f"Number of cells: {len(library.cells)}", file=output)
-        print(f"Cells: {[cell.name for cell in library.cells]}", file=output)
-        print("", file=output)
-
-        for cell in library.cells:
-            print(f"Cell: {cell.name}", file=output)
-            print(f"  Polygons: {len(cell.polygons)}", file=output)
-            print(f"  Paths: {len(cell.paths)}", file=output)
-            print(f"  Labels: {len(cell.labels)}", file=output)
-            print(f"  References: {len(cell.references)}", file=output)
-
-            for poly in cell.polygons:
-                print(f"    Polygon - Layer {poly.layer}, datatype {poly.datatype}", file=output)
-                print(f"      Points: {poly.points}", file=output)
-
-            for path in cell.paths:
-                # Handle both RobustPath and FlexPath which have different attributes
-                if hasattr(path, 'layers'):
-                    # FlexPath has layers (list) and datatypes (list)
-                    print(f"    Path - Layers {path.layers}, datatypes {path.datatypes}", file=output)
-                else:
-                    # RobustPath has layer and datatype
-                    print(f"    Path - Layer {path.layer}, datatype {path.datatype}", file=output)
+        sys.stdout.write(text)
 
-                if hasattr(path, 'spine'):
-                    print(f"      Spine points: {path.spine()}", file=output)
-                elif hasattr(path, 'points'):
-                    print(f"      Points: {path.points}", file=output)
 
-            for label in cell.labels:
-                print(f"    Label - Layer {label.layer}, texttype {label.texttype}", file=output)
-                print(f"      Text: {label.text}, Origin: {label.origin}", file=output)
+def inspect_gds(gds_file, log_file=None, summary=False, raw=False):
+    """
+    Inspect a GDS file and print its structure.
 
-            for ref in cell.references:
-                if hasattr(ref, 'cell'):
-                    print(f"    Reference to cell: {ref.cell.name if ref.cell else 'Unknown'}", file=output)
-                print(f"      Origin: {ref.origin}", file=output)
-                print(f"      Rotation: {ref.rotation} degrees", file=output)
-                print(f"      Magnification: {ref.magnification}", file=output)
-                print(f"      X-reflection: {ref.x_reflection}", file=output)
-                if hasattr(ref, 'columns') and ref.columns > 1:
-                    print(f"      Array: {ref.columns} columns x {ref.rows} rows", file=output)
-                    print(f"      Spacing: {ref.spacing}", file=output)
+    Args:
+        gds_file: Path to the GDS file to read
+        log_file: Optional path to log file. If None, prints to stdout
+        summary: If True, print per-cell polygon statistics instead of
+            dumping every element
+        raw: If True, only list cells and their sizes. Cells are read with
+            gdstk.read_rawcells, which skips decoding their elements
+    """
+    # Collect output lines and write them in one go at the end
+    lines = []
+    emit = lines.append
+
+    if raw:
+        raw_cells = gdstk.read_rawcells(gds_file)
+        emit(f"Number of cells: {len(raw_cells)}")
+        for name, raw_cell in raw_cells.items():
+            emit(f"Cell: {name}, size: {raw_cell.size} bytes")
+        write_output(lines, log_file)
+        return
+
+    library = gdstk.read_gds(gds_file)
+    # library.cells builds a new list on every access, so read it once
+    cells = library.cells
+
+    # Inspect structure
+    emit(f"Library: {library.name}")
+    emit(f"Number of cells: {len(cells)}")
+    emit("Cells: " + ", ".join(cell.name for cell in cells))
+    emit("")
+
+    for cell in cells:
+        # Each of these properties builds a new list, so fetch them once
+        polys = cell.polygons
+        paths = cell.paths
+        labels = cell.labels
+        refs = cell.references
+
+        emit(f"Cell: {cell.name}")
+        emit(f"  Polygons: {len(polys)}")
+        emit(f"  Paths: {len(paths)}")
+        emit(f"  Labels: {len(labels)}")
+        emit(f"  References: {len(refs)}")
+
+        if summary:
+            vertices, area, bbox = summarize_polygons(polys)
+            emit(f"  Vertices: {vertices}")
+            emit(f"  Polygon area: {area}")
+            emit(f"  Polygon bounding box: {bbox}")
+            emit("")
+            continue
+
+        for poly in polys:
+            emit(POLY_TEMPLATE(
+                layer=poly.layer,
+                dt=poly.datatype,
+                pts=format_points(poly.points)
+            ))
+
+        for path in paths:
+            # cell.paths only holds FlexPath and RobustPath, which both carry
+            # per-element layers/datatypes and a spine. Each attribute read
+            # builds a new object, so read them once.
+            layers = path.layers
+            datatypes = path.datatypes
+            spine = path.spine()
+            emit(f"    Path - Layers {layers}, datatypes {datatypes}")
+            emit(f"      Spine points: {format_points(spine)}")
+
+        for label in labels:
+            emit(f"    Label - Layer {label.layer}, texttype {label.texttype}")
+            emit(f"      Text: {label.text}, Origin: {label.origin}")
+
+        for ref in refs:
+            emit(f"    Reference to cell: {ref.cell.name if ref.cell else 'Unknown'}")
+            emit(f"      Origin: {ref.origin}")
+            emit(f"      Rotation: {ref.rotation} degrees")
+            emit(f"      Magnification: {ref.magnification}")
+            emit(f"      X-reflection: {ref.x_reflection}")
+            # Arrays (AREF) are stored as a repetition on the reference. gdstk
+            # reads them back as regular repetitions (v1/v2 set, spacing None);
+            # rectangular ones only carry spacing. Without an array, the
+            # repetition has size 0.
+            rep = ref.repetition
+            if rep.columns is not None and rep.size > 1:
+                emit(f"      Array: {rep.columns} columns x {rep.rows} rows")
+                if rep.spacing is None:
+                    emit(f"      Vectors: v1={rep.v1}, v2={rep.v2}")
+                else:
+                    emit(f"      Spacing: {rep.spacing}")
 
-            print("", file=output)
+        emit("")
 
-    finally:
-        if log_file and output != sys.stdout:
-            output.close()
+    write_output(lines, log_file)
 
 
 def main():
@@ -78,19 +192,51 @@ def main():
         description='Inspect GDS file structure and print detailed information'
     )
     parser.add_argument(
-        'gds_file',
-        help='Path to the GDS file to read'
+        'gds_files',
+        nargs='+',
+        metavar='gds_file',
+        help='Path to the GDS file(s) to read'
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        '--summary',
+        action='store_true',
+        help='Print per-cell polygon statistics instead of every element'
+    )
+    mode.add_argument(
+        '--raw',
+        action='store_true',
+        help='Only list cells and their sizes, without decoding any elements'
     )
     parser.add_argument(
         '-o', '--output',
         dest='log_file',
-        help='Path to log file (default: print to stdout)',
+        help='Path to log file (default: print to stdout). Only valid with a '
+             'single input; several inputs are each written to <gds_file>.log',
         default=None
     )
 
     args = parser.parse_args()
 
-    inspect_gds(args.gds_file, args.log_file)
+    if len(args.gds_files) == 1:
+        inspect_gds(args.gds_files[0], args.log_file, args.summary, args.raw)
+        return
+
+    if args.log_file:
+        parser.error('-o/--output can only be used with a single GDS file')
+
+    # Files are independent, so inspect them in parallel processes
+    log_files = [f"{gds_file}.log" for gds_file in args.gds_files]
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(
+            inspect_gds,
+            args.gds_files,
+            log_files,
+            [args.summary] * len(args.gds_files),
+            [args.raw] * len(args.gds_files)
+        ))
+    for log_file in log_files:
+        print(f"Wrote {log_file}")
 
 
 if __name__ == '__main__':